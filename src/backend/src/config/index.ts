@@ -12,6 +12,8 @@ export interface AppConfig {
   };
   openai: {
     apiKey: string;
+    maxConcurrentRequests: number;
+    requestsPerMinute: number;
   };
   pinecone?: {
     apiKey: string;
@@ -22,12 +24,27 @@ export interface AppConfig {
     origin: string[];
     credentials: boolean;
   };
+  analysis: {
+    maxConcurrentRuns: number;
+  };
+  compression: {
+    level: number;
+    threshold: number; // in bytes
+  };
   upload: {
     maxFileSize: number; // in bytes
     allowedMimeTypes: string[];
   };
 }
 
+/**
+ * Read a positive integer setting, falling back to the default when unset or invalid
+ */
+function parsePositiveInt(value: string | undefined, fallback: number): number {
+  const parsed = parseInt(value || '', 10);
+  return Number.isFinite(parsed) && parsed >= 1 ? parsed : fallback;
+}
+
 export const config: AppConfig = {
   port: parseInt(process.env.PORT || '5000', 10),
   nodeEnv: process.env.NODE_ENV || 'development',
@@ -37,6 +54,8 @@ export const config: AppConfig = {
   },
   openai: {
     apiKey: process.env.OPENAI_API_KEY || '',
+    maxConcurrentRequests: parsePositiveInt(process.env.OPENAI_MAX_CONCURRENT_REQUESTS, 5),
+    requestsPerMinute: parsePositiveInt(process.env.OPENAI_REQUESTS_PER_MINUTE, 500),
   },
   pinecone: process.env.PINECONE_API_KEY ? {
     apiKey: process.env.PINECONE_API_KEY,
@@ -47,6 +66,13 @@ export const config: AppConfig = {
     origin: ['http://localhost:3000', 'http://localhost:3001'], // Add production URLs as needed
     credentials: true,
   },
+  analysis: {
+    maxConcurrentRuns: parsePositiveInt(process.env.ANALYSIS_MAX_CONCURRENT_RUNS, 4),
+  },
+  compression: {
+    level: 6,
+    threshold: 500, // Skip tiny payloads such as /health
+  },
   upload: {
     maxFileSize: 50 * 1024 * 1024, // 50MB
     allowedMimeTypes: [
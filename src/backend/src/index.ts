@@ -1,6 +1,7 @@
 import express from 'express';
 import cors from 'cors';
 import helmet from 'helmet';
+import compression from 'compression';
 import morgan from 'morgan';
 import { config, validateConfig } from './config';
 import { SupabaseConfig } from './config/supabase';
@@ -39,6 +40,12 @@ app.use(cors({
   allowedHeaders: ['Content-Type', 'Authorization', 'x-api-key']
 }));
 
+// Response compression (gzip/deflate negotiated via Accept-Encoding)
+app.use(compression({
+  level: config.compression.level,
+  threshold: config.compression.threshold
+}));
+
 // Request logging
 if (config.nodeEnv === 'development') {
   app.use(morgan('dev'));
@@ -53,19 +60,21 @@ app.use(express.urlencoded({ extended: true, limit: '10mb' }));
 // API routes
 app.use('/api', apiRoutes);
 
-// Root endpoint
+// Root endpoint (static payload, serialized once at startup)
+const rootResponseBody = JSON.stringify({
+  success: true,
+  message: 'Qualitative Insight Engine API',
+  version: '1.0.0',
+  documentation: '/api/health',
+  endpoints: {
+    health: '/api/health',
+    projects: '/api/projects',
+    analysis: '/api/analysis'
+  }
+});
+
 app.get('/', (req, res) => {
-  res.json({
-    success: true,
-    message: 'Qualitative Insight Engine API',
-    version: '1.0.0',
-    documentation: '/api/health',
-    endpoints: {
-      health: '/api/health',
-      projects: '/api/projects',
-      analysis: '/api/analysis'
-    }
-  });
+  res.type('application/json').send(rootResponseBody);
 });
 
 // Global error handler
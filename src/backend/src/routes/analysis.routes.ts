@@ -1,7 +1,26 @@
 import { Router, Request, Response } from 'express';
+import { createHash } from 'crypto';
 import { getAnalysisService, getAIProcessorService, getProjectsService, getUploadsService } from '../services';
 import { validate, analysisValidation } from '../middleware/validation.middleware';
 import { authMiddleware, validateProjectAccess } from '../middleware/auth.middleware';
+import { createLimiter, settleAll } from '../utils/concurrency';
+import { config } from '../config';
+import { Database } from '../types/database.types';
+import { ObjectiveData } from '../services/ai-processor.service';
+
+type DiscussionGuide = Database['public']['Tables']['discussion_guides']['Row'];
+type Transcript = Database['public']['Tables']['transcripts']['Row'];
+type Verbatim = Database['public']['Tables']['qualitative_verbatims']['Row'];
+
+interface ProjectFiles {
+  guide: DiscussionGuide | null;
+  transcripts: Transcript[];
+}
+
+interface CachedObjectives {
+  objectives?: ObjectiveData[];
+  contentHash?: string;
+}
 
 const router = Router();
 const analysisService = getAnalysisService();
@@ -9,6 +28,13 @@ const aiProcessorService = getAIProcessorService();
 const projectsService = getProjectsService();
 const uploadsService = getUploadsService();
 
+// Bound the number of analysis runs in flight; further runs queue until a slot frees up
+const runAnalysis = createLimiter(config.analysis.maxConcurrentRuns);
+
+// Sessions that are queued or running on this server; a queued session is
+// still 'created' in the database, so status alone can't guard against retries
+const activeSessions = new Set<string>();
+
 // Apply auth middleware to all routes
 router.use(authMiddleware);
 
@@ -30,8 +56,7 @@ router.post('/start', validate(analysisValidation.start), async (req: Request, r
     }
 
     // Check if project has discussion guide and transcripts
-    const guide = await uploadsService.getProjectDiscussionGuide(projectId);
-    const transcripts = await uploadsService.getProjectTranscripts(projectId);
+    const { guide, transcripts } = await loadProjectFiles(projectId);
     
     if (!guide) {
       return res.status(400).json({
@@ -55,7 +80,7 @@ router.post('/start', validate(analysisValidation.start), async (req: Request, r
 
     // Start analysis process asynchronously
     // This would typically be handled by an Edge Function or background job
-    processAnalysisAsync(session.id, projectId);
+    scheduleAnalysis(session.id, projectId);
 
     res.status(201).json({
       success: true,
@@ -250,23 +275,31 @@ router.post('/retry/:sessionId', async (req: Request, res: Response) => {
       });
     }
 
-    if (session.status === 'processing') {
+    if (session.status === 'processing' || activeSessions.has(sessionId)) {
       return res.status(400).json({
         success: false,
         error: 'Analysis is already in progress'
       });
     }
 
+    // Claim the session before awaiting so a concurrent retry can't schedule it twice
+    activeSessions.add(sessionId);
+
     // Reset session to processing state
-    await analysisService.updateAnalysisProgress(
-      sessionId,
-      0,
-      'Restarting analysis',
-      300
-    );
+    try {
+      await analysisService.updateAnalysisProgress(
+        sessionId,
+        0,
+        'Restarting analysis',
+        300
+      );
+    } catch (error) {
+      activeSessions.delete(sessionId);
+      throw error;
+    }
 
     // Start analysis process again
-    processAnalysisAsync(sessionId, session.project_id);
+    scheduleAnalysis(sessionId, session.project_id);
 
     res.json({
       success: true,
@@ -286,6 +319,78 @@ router.post('/retry/:sessionId', async (req: Request, res: Response) => {
   }
 });
 
+/**
+ * Fetch a project's discussion guide and transcripts in one round of queries
+ */
+async function loadProjectFiles(projectId: string): Promise<ProjectFiles> {
+  const [guide, transcripts] = await Promise.all([
+    uploadsService.getProjectDiscussionGuide(projectId),
+    uploadsService.getProjectTranscripts(projectId)
+  ]);
+
+  return { guide, transcripts };
+}
+
+/**
+ * Return objectives persisted for this exact guide content, if any
+ */
+function getCachedObjectives(guide: DiscussionGuide, contentHash: string): ObjectiveData[] | null {
+  const cached = guide.objectives as unknown as CachedObjectives | null;
+  if (!cached || cached.contentHash !== contentHash || !Array.isArray(cached.objectives)) {
+    return null;
+  }
+
+  return cached.objectives.length > 0 ? cached.objectives : null;
+}
+
+/**
+ * Load guide objectives, reusing those from a previous run when the guide content is unchanged
+ */
+async function loadGuideObjectives(guide: DiscussionGuide, content: string): Promise<ObjectiveData[]> {
+  const contentHash = createHash('sha256').update(content).digest('hex');
+  const cached = getCachedObjectives(guide, contentHash);
+  if (cached) {
+    return cached;
+  }
+
+  const objectives = await aiProcessorService.extractGuideObjectives(content);
+  await uploadsService.updateDiscussionGuideContent(guide.id, content, { objectives, contentHash });
+  return objectives;
+}
+
+/**
+ * Extract verbatims from every transcript with content, concurrently under the OpenAI request limit.
+ * A failed transcript fails the step only after the others have finished.
+ */
+async function extractProjectVerbatims(projectId: string, transcripts: Transcript[]): Promise<Verbatim[]> {
+  const transcriptVerbatims = await settleAll(
+    transcripts
+      .filter(transcript => transcript.content)
+      .map(transcript => aiProcessorService.extractVerbatims(
+        projectId,
+        transcript.id,
+        transcript.content as string,
+        transcript.file_name
+      ))
+  );
+
+  return transcriptVerbatims.flat();
+}
+
+/**
+ * Queue an analysis run on the bounded runner without awaiting it
+ */
+function scheduleAnalysis(sessionId: string, projectId: string): void {
+  activeSessions.add(sessionId);
+  runAnalysis(() => processAnalysisAsync(sessionId, projectId))
+    .catch((error) => {
+      console.error(`Analysis runner error for session ${sessionId}:`, error);
+    })
+    .finally(() => {
+      activeSessions.delete(sessionId);
+    });
+}
+
 /**
  * Async function to process analysis (would be moved to Edge Function)
  */
@@ -296,31 +401,21 @@ async function processAnalysisAsync(sessionId: string, projectId: string): Promi
     // Step 1: Extract objectives from discussion guide
     await analysisService.updateAnalysisProgress(sessionId, 10, 'Extracting objectives from guide');
     
-    const guide = await uploadsService.getProjectDiscussionGuide(projectId);
+    // Load files when the run starts so a queued run neither pins nor reuses a stale snapshot
+    const { guide, transcripts } = await loadProjectFiles(projectId);
     if (!guide || !guide.content) {
       throw new Error('Discussion guide content not found');
     }
 
-    const objectives = await aiProcessorService.extractGuideObjectives(guide.content);
-    await uploadsService.updateDiscussionGuideContent(guide.id, guide.content, { objectives });
-
-    // Step 2: Extract verbatims from transcripts
-    await analysisService.updateAnalysisProgress(sessionId, 25, 'Extracting verbatims from transcripts');
-    
-    const transcripts = await uploadsService.getProjectTranscripts(projectId);
-    const allVerbatims = [];
-    
-    for (const transcript of transcripts) {
-      if (transcript.content) {
-        const verbatims = await aiProcessorService.extractVerbatims(
-          projectId,
-          transcript.id,
-          transcript.content,
-          transcript.file_name
-        );
-        allVerbatims.push(...verbatims);
-      }
-    }
+    // Step 2: Extract verbatims from transcripts, overlapping with step 1
+    // since the guide and transcripts are independent inputs. Both branches
+    // settle before a failure is raised, so none keeps writing after the
+    // session is marked failed.
+    const [objectives, allVerbatims] = await settleAll([
+      loadGuideObjectives(guide, guide.content),
+      analysisService.updateAnalysisProgress(sessionId, 25, 'Extracting verbatims from transcripts')
+        .then(() => extractProjectVerbatims(projectId, transcripts))
+    ]);
 
     // Step 3: Map verbatims to questions
     await analysisService.updateAnalysisProgress(sessionId, 50, 'Mapping verbatims to questions');
@@ -332,29 +427,22 @@ async function processAnalysisAsync(sessionId: string, projectId: string): Promi
     // Step 4: Analyze emergent topics
     await analysisService.updateAnalysisProgress(sessionId, 70, 'Analyzing emergent topics');
     
-    if (allVerbatims.length > 0) {
-      await aiProcessorService.analyzeEmergentTopics(projectId, allVerbatims);
-    }
+    const emergentTopics = allVerbatims.length > 0
+      ? await aiProcessorService.analyzeEmergentTopics(projectId, allVerbatims)
+      : [];
 
     // Step 5: Strategic analysis
     await analysisService.updateAnalysisProgress(sessionId, 85, 'Performing strategic analysis');
     
-    const topics = await aiProcessorService.getProjectTopics(projectId);
+    // Group this run's topic assignments in memory rather than re-querying each topic
+    const topics = aiProcessorService.groupTopicVerbatims(emergentTopics, allVerbatims);
     for (const topic of topics) {
-      const topicVerbatims = await aiProcessorService.getTopicVerbatims(
+      await aiProcessorService.performStrategicAnalysis(
         projectId,
         topic.broad_topic,
-        topic.sub_topic
+        topic.sub_topic,
+        topic.verbatims
       );
-      
-      if (topicVerbatims.length > 0) {
-        await aiProcessorService.performStrategicAnalysis(
-          projectId,
-          topic.broad_topic,
-          topic.sub_topic,
-          topicVerbatims
-        );
-      }
     }
 
     // Step 6: Generate final report
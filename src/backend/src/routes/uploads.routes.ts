@@ -1,5 +1,7 @@
-import { Router, Request, Response } from 'express';
+import { Router, Request, Response, NextFunction } from 'express';
 import multer from 'multer';
+import os from 'os';
+import { promises as fs } from 'fs';
 import { getUploadsService } from '../services';
 import { validate, uploadValidation, validateFileUpload } from '../middleware/validation.middleware';
 import { authMiddleware, validateProjectAccess } from '../middleware/auth.middleware';
@@ -9,8 +11,10 @@ const router = Router();
 const uploadsService = getUploadsService();
 
 // Configure multer for file uploads
+// Files are streamed to the OS temp dir rather than buffered in memory, so a
+// 10 x 50MB transcript batch does not have to fit in the worker's heap.
 const upload = multer({
-  storage: multer.memoryStorage(),
+  storage: multer.diskStorage({ destination: os.tmpdir() }),
   limits: {
     fileSize: config.upload.maxFileSize,
     files: 10 // Maximum 10 files per upload
@@ -24,6 +28,25 @@ const upload = multer({
   }
 });
 
+/**
+ * Remove multer temp files once the response has been sent,
+ * regardless of which handler (or validator) ended the request.
+ */
+const cleanupTempFiles = (req: Request, res: Response, next: NextFunction): void => {
+  res.on('close', () => {
+    const files: Express.Multer.File[] = [];
+    if (req.file) files.push(req.file);
+    if (Array.isArray(req.files)) files.push(...req.files);
+
+    for (const file of files) {
+      if (file.path) {
+        fs.unlink(file.path).catch(() => undefined);
+      }
+    }
+  });
+  next();
+};
+
 // Apply auth middleware to all routes
 router.use(authMiddleware);
 
@@ -35,6 +58,7 @@ router.post(
   '/:projectId/upload/guide',
   validate(uploadValidation.files),
   validateProjectAccess,
+  cleanupTempFiles,
   upload.single('file'),
   validateFileUpload,
   async (req: Request, res: Response) => {
@@ -82,6 +106,7 @@ router.post(
   '/:projectId/upload/transcripts',
   validate(uploadValidation.files),
   validateProjectAccess,
+  cleanupTempFiles,
   upload.array('files', 10),
   validateFileUpload,
   async (req: Request, res: Response) => {
@@ -99,18 +124,19 @@ router.post(
       const uploadedTranscripts = [];
       const errors = [];
 
-      // Process each file
-      for (const file of files) {
-        try {
-          const transcript = await uploadsService.uploadTranscript(
-            projectId,
-            file
-          );
-          uploadedTranscripts.push(transcript);
-        } catch (error) {
+      // Upload files concurrently; each file succeeds or fails independently
+      const results = await Promise.allSettled(
+        files.map(file => uploadsService.uploadTranscript(projectId, file))
+      );
+
+      for (let i = 0; i < results.length; i++) {
+        const result = results[i];
+        if (result.status === 'fulfilled') {
+          uploadedTranscripts.push(result.value);
+        } else {
           errors.push({
-            fileName: file.originalname,
-            error: error instanceof Error ? error.message : 'Unknown error'
+            fileName: files[i].originalname,
+            error: result.reason instanceof Error ? result.reason.message : 'Unknown error'
           });
         }
       }
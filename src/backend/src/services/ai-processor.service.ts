@@ -2,6 +2,8 @@ import { OpenAI } from 'openai';
 import { supabase } from '../config/supabase';
 import { Database, VerbatimData, TopicAssignment, QuestionMapping, StrategicAnalysisResult } from '../types/database.types';
 import { v4 as uuidv4 } from 'uuid';
+import { config } from '../config';
+import { createLimiter, createRateLimiter, settleAll } from '../utils/concurrency';
 
 type Verbatim = Database['public']['Tables']['qualitative_verbatims']['Row'];
 type VerbatimInsert = Database['public']['Tables']['qualitative_verbatims']['Insert'];
@@ -12,6 +14,21 @@ type QuestionMappingInsert = Database['public']['Tables']['question_mappings']['
 type StrategicAnalysis = Database['public']['Tables']['strategic_analyses']['Row'];
 type StrategicAnalysisInsert = Database['public']['Tables']['strategic_analyses']['Insert'];
 
+// Number of verbatims packed into a single question-mapping request
+const DEFAULT_MAPPING_BATCH_SIZE = 20;
+
+/**
+ * Render verbatims as the numbered quote list shared by the analysis prompts
+ */
+function formatVerbatimList(verbatims: Verbatim[]): string {
+  return verbatims.map((v, idx) => `${idx + 1}: "${v.text}" - ${v.speaker}`).join('\n');
+}
+
+interface CompletionOptions {
+  temperature: number;
+  max_tokens?: number;
+}
+
 export interface ObjectiveData {
   id: string;
   section: string;
@@ -19,6 +36,12 @@ export interface ObjectiveData {
   objective: string;
 }
 
+export interface TopicVerbatims {
+  broad_topic: string;
+  sub_topic: string;
+  verbatims: Verbatim[];
+}
+
 export interface ProcessedVerbatim extends VerbatimData {
   id?: string;
   projectId: string;
@@ -26,12 +49,34 @@ export interface ProcessedVerbatim extends VerbatimData {
 }
 
 export class AIProcessorService {
-  private openai: OpenAI;
-  
-  constructor() {
-    this.openai = new OpenAI({
-      apiKey: process.env.OPENAI_API_KEY
-    });
+  private openaiClient: OpenAI | null = null;
+  private limitRequests = createLimiter(config.openai.maxConcurrentRequests);
+  private throttleRequests = createRateLimiter(config.openai.requestsPerMinute);
+
+  /**
+   * Create the OpenAI client on first use so startup and non-AI routes don't pay for it
+   */
+  private get openai(): OpenAI {
+    if (!this.openaiClient) {
+      this.openaiClient = new OpenAI({
+        apiKey: process.env.OPENAI_API_KEY
+      });
+    }
+    return this.openaiClient;
+  }
+
+  /**
+   * Send a single user prompt through the request limiters and parse the JSON reply
+   */
+  private async completeJson<T>(prompt: string, options: CompletionOptions): Promise<T | null> {
+    const response = await this.limitRequests(() => this.throttleRequests(() => this.openai.chat.completions.create({
+      model: "gpt-4",
+      messages: [{ role: "user", content: prompt }],
+      ...options
+    })));
+
+    const content = response.choices[0]?.message?.content;
+    return content ? JSON.parse(content) : null;
   }
 
   /**
@@ -55,18 +100,12 @@ export class AIProcessorService {
         ${guideContent}
       `;
 
-      const response = await this.openai.chat.completions.create({
-        model: "gpt-4",
-        messages: [{ role: "user", content: prompt }],
-        temperature: 0.3
-      });
-
-      const content = response.choices[0]?.message?.content;
-      if (!content) {
+      const objectives = await this.completeJson<ObjectiveData[]>(prompt, { temperature: 0.3 });
+      if (!objectives) {
         throw new Error('No response from OpenAI');
       }
 
-      return JSON.parse(content);
+      return objectives;
     } catch (error) {
       console.error('Error extracting guide objectives:', error);
       throw new Error(`Failed to extract objectives: ${error}`);
@@ -104,21 +143,13 @@ export class AIProcessorService {
         ${transcriptContent}
       `;
 
-      const response = await this.openai.chat.completions.create({
-        model: "gpt-4",
-        messages: [{ role: "user", content: prompt }],
-        temperature: 0.2,
-        max_tokens: 4000
-      });
-
-      const content = response.choices[0]?.message?.content;
-      if (!content) {
+      const extractedVerbatims = await this.completeJson<any[]>(prompt, { temperature: 0.2, max_tokens: 4000 });
+      if (!extractedVerbatims) {
         throw new Error('No response from OpenAI');
       }
-
-      const extractedVerbatims = JSON.parse(content);
       
       // Save verbatims to database
+      const createdAt = new Date().toISOString();
       const verbatimRecords: VerbatimInsert[] = extractedVerbatims.map((v: any) => ({
         id: uuidv4(),
         project_id: projectId,
@@ -127,7 +158,7 @@ export class AIProcessorService {
         speaker: v.speaker,
         source_file: sourceFileName,
         line_number: v.line_number || null,
-        created_at: new Date().toISOString()
+        created_at: createdAt
       }));
 
       const { data, error } = await supabase
@@ -152,68 +183,46 @@ export class AIProcessorService {
   async mapVerbatimsToQuestions(
     projectId: string,
     verbatims: Verbatim[],
-    objectives: ObjectiveData[]
+    objectives: ObjectiveData[],
+    batchSize: number = DEFAULT_MAPPING_BATCH_SIZE
   ): Promise<QuestionMappingRow[]> {
     try {
-      const mappings: QuestionMappingInsert[] = [];
-
-      // Process verbatims in batches to avoid token limits
-      const batchSize = 10;
-      for (let i = 0; i < verbatims.length; i += batchSize) {
-        const batch = verbatims.slice(i, i + batchSize);
-        
-        const prompt = `
-          Map these verbatims to the most relevant discussion guide question.
-          
-          Discussion Guide Questions:
-          ${objectives.map(obj => `${obj.id}: ${obj.question}`).join('\n')}
-          
-          Verbatims to map:
-          ${batch.map((v, idx) => `${idx + 1}: "${v.text}" - ${v.speaker}`).join('\n')}
-          
-          Return JSON array with structure:
-          [
-            {
-              "verbatim_index": 1,
-              "best_fit_question_id": "ID-3",
-              "confidence": "High|Medium|Low",
-              "reasoning": "Why this question is the best fit"
-            }
-          ]
-        `;
-
-        const response = await this.openai.chat.completions.create({
-          model: "gpt-4",
-          messages: [{ role: "user", content: prompt }],
-          temperature: 0.1
-        });
-
-        const content = response.choices[0]?.message?.content;
-        if (!content) continue;
-
-        const batchMappings = JSON.parse(content);
-        
-        for (const mapping of batchMappings) {
-          const verbatimIndex = mapping.verbatim_index - 1;
-          if (verbatimIndex >= 0 && verbatimIndex < batch.length) {
-            const verbatim = batch[verbatimIndex];
-            const objective = objectives.find(obj => obj.id === mapping.best_fit_question_id);
-            
-            if (objective && mapping.confidence !== 'Low') {
-              mappings.push({
-                id: uuidv4(),
-                project_id: projectId,
-                verbatim_id: verbatim.id,
-                question_section: objective.section,
-                question_text: objective.question,
-                confidence: mapping.confidence as 'High' | 'Medium' | 'Low',
-                reasoning: mapping.reasoning,
-                created_at: new Date().toISOString()
-              });
-            }
-          }
+      // Send each distinct text once; repeats reuse the first occurrence's mapping
+      const duplicatesByText = new Map<string, Verbatim[]>();
+      for (const verbatim of verbatims) {
+        const duplicates = duplicatesByText.get(verbatim.text);
+        if (duplicates) {
+          duplicates.push(verbatim);
+        } else {
+          duplicatesByText.set(verbatim.text, [verbatim]);
         }
       }
+      const duplicatesById = new Map(
+        Array.from(duplicatesByText.values(), duplicates => [duplicates[0].id, duplicates] as [string, Verbatim[]])
+      );
+      const uniqueVerbatims = Array.from(duplicatesByText.values(), duplicates => duplicates[0]);
+
+      // Process verbatims in batches to avoid token limits; batches run
+      // concurrently, bounded by the shared OpenAI request limiter
+      const batches: Verbatim[][] = [];
+      for (let i = 0; i < uniqueVerbatims.length; i += batchSize) {
+        batches.push(uniqueVerbatims.slice(i, i + batchSize));
+      }
+
+      // Render the question list and index objectives once for all batches
+      const questionList = objectives.map(obj => `${obj.id}: ${obj.question}`).join('\n');
+      const objectivesById = new Map(objectives.map(obj => [obj.id, obj]));
+
+      // Let every batch settle before failing so none keeps holding the shared limiters
+      const batchMappings = await settleAll(
+        batches.map(batch => this.mapBatchToQuestions(projectId, batch, questionList, objectivesById))
+      );
+      const mappings = batchMappings.flat().flatMap(mapping => {
+        const duplicates = duplicatesById.get(mapping.verbatim_id) || [];
+        return duplicates.map((verbatim, idx) =>
+          idx === 0 ? mapping : { ...mapping, id: uuidv4(), verbatim_id: verbatim.id }
+        );
+      });
 
       // Save mappings to database
       if (mappings.length > 0) {
@@ -236,6 +245,65 @@ export class AIProcessorService {
     }
   }
 
+  /**
+   * Map a single batch of verbatims to discussion guide questions
+   */
+  private async mapBatchToQuestions(
+    projectId: string,
+    batch: Verbatim[],
+    questionList: string,
+    objectivesById: Map<string, ObjectiveData>
+  ): Promise<QuestionMappingInsert[]> {
+    const prompt = `
+      Map these verbatims to the most relevant discussion guide question.
+      
+      Discussion Guide Questions:
+      ${questionList}
+      
+      Verbatims to map:
+      ${formatVerbatimList(batch)}
+      
+      Return JSON array with structure:
+      [
+        {
+          "verbatim_index": 1,
+          "best_fit_question_id": "ID-3",
+          "confidence": "High|Medium|Low",
+          "reasoning": "Why this question is the best fit"
+        }
+      ]
+    `;
+
+    const batchMappings = await this.completeJson<any[]>(prompt, { temperature: 0.1 });
+    if (!batchMappings) return [];
+
+    const mappings: QuestionMappingInsert[] = [];
+    const createdAt = new Date().toISOString();
+    
+    for (const mapping of batchMappings) {
+      const verbatimIndex = mapping.verbatim_index - 1;
+      if (verbatimIndex >= 0 && verbatimIndex < batch.length) {
+        const verbatim = batch[verbatimIndex];
+        const objective = objectivesById.get(mapping.best_fit_question_id);
+        
+        if (objective && mapping.confidence !== 'Low') {
+          mappings.push({
+            id: uuidv4(),
+            project_id: projectId,
+            verbatim_id: verbatim.id,
+            question_section: objective.section,
+            question_text: objective.question,
+            confidence: mapping.confidence as 'High' | 'Medium' | 'Low',
+            reasoning: mapping.reasoning,
+            created_at: createdAt
+          });
+        }
+      }
+    }
+
+    return mappings;
+  }
+
   /**
    * Analyze emergent topics from verbatims
    */
@@ -249,7 +317,7 @@ export class AIProcessorService {
         Group similar ideas into broad topics and sub-topics.
         
         Verbatims:
-        ${verbatims.map((v, idx) => `${idx + 1}: "${v.text}" - ${v.speaker}`).join('\n')}
+        ${formatVerbatimList(verbatims)}
         
         Return JSON with structure:
         {
@@ -263,20 +331,13 @@ export class AIProcessorService {
         }
       `;
 
-      const response = await this.openai.chat.completions.create({
-        model: "gpt-4",
-        messages: [{ role: "user", content: prompt }],
-        temperature: 0.3,
-        max_tokens: 3000
-      });
-
-      const content = response.choices[0]?.message?.content;
-      if (!content) {
+      const result = await this.completeJson<any>(prompt, { temperature: 0.3, max_tokens: 3000 });
+      if (!result) {
         throw new Error('No response from OpenAI');
       }
 
-      const result = JSON.parse(content);
       const topicRecords: EmergentTopicInsert[] = [];
+      const createdAt = new Date().toISOString();
 
       for (const topic of result.topics) {
         for (const verbatimIndex of topic.verbatim_indices) {
@@ -288,7 +349,7 @@ export class AIProcessorService {
               verbatim_id: verbatim.id,
               broad_topic: topic.broad_topic,
               sub_topic: topic.sub_topic,
-              created_at: new Date().toISOString()
+              created_at: createdAt
             });
           }
         }
@@ -332,7 +393,7 @@ export class AIProcessorService {
         Topic: ${broadTopic} - ${subTopic}
         
         Related Verbatims:
-        ${relatedVerbatims.map((v, idx) => `${idx + 1}: "${v.text}" - ${v.speaker}`).join('\n')}
+        ${formatVerbatimList(relatedVerbatims)}
         
         Return JSON with structure:
         {
@@ -343,18 +404,10 @@ export class AIProcessorService {
         }
       `;
 
-      const response = await this.openai.chat.completions.create({
-        model: "gpt-4",
-        messages: [{ role: "user", content: prompt }],
-        temperature: 0.2
-      });
-
-      const content = response.choices[0]?.message?.content;
-      if (!content) {
+      const analysis = await this.completeJson<any>(prompt, { temperature: 0.2 });
+      if (!analysis) {
         throw new Error('No response from OpenAI');
       }
-
-      const analysis = JSON.parse(content);
       
       const analysisRecord: StrategicAnalysisInsert = {
         id: uuidv4(),
@@ -387,37 +440,33 @@ export class AIProcessorService {
   }
 
   /**
-   * Get verbatims for a specific topic
+   * Group verbatims by their assigned broad and sub topic, in first-seen order
    */
-  async getTopicVerbatims(projectId: string, broadTopic: string, subTopic: string): Promise<Verbatim[]> {
-    const { data, error } = await supabase
-      .from('emergent_topics')
-      .select(`
-        verbatim_id,
-        qualitative_verbatims (*)
-      `)
-      .eq('project_id', projectId)
-      .eq('broad_topic', broadTopic)
-      .eq('sub_topic', subTopic);
-
-    if (error) {
-      throw new Error(`Failed to get topic verbatims: ${error.message}`);
-    }
-
-    return data?.map(item => (item as any).qualitative_verbatims).filter(Boolean) || [];
-  }
+  groupTopicVerbatims(topics: EmergentTopic[], verbatims: Verbatim[]): TopicVerbatims[] {
+    const verbatimsById = new Map(verbatims.map(v => [v.id, v]));
+    const groups = new Map<string, Map<string, TopicVerbatims>>();
+    const ordered: TopicVerbatims[] = [];
+
+    for (const topic of topics) {
+      const verbatim = verbatimsById.get(topic.verbatim_id);
+      if (!verbatim) continue;
+
+      let subTopics = groups.get(topic.broad_topic);
+      if (!subTopics) {
+        subTopics = new Map();
+        groups.set(topic.broad_topic, subTopics);
+      }
 
-  /**
-   * Get all unique topics for a project
-   */
-  async getProjectTopics(projectId: string): Promise<Array<{broad_topic: string, sub_topic: string, count: number}>> {
-    const { data, error } = await supabase
-      .rpc('get_topic_hierarchy', { project_uuid: projectId });
+      let group = subTopics.get(topic.sub_topic);
+      if (!group) {
+        group = { broad_topic: topic.broad_topic, sub_topic: topic.sub_topic, verbatims: [] };
+        subTopics.set(topic.sub_topic, group);
+        ordered.push(group);
+      }
 
-    if (error) {
-      throw new Error(`Failed to get project topics: ${error.message}`);
+      group.verbatims.push(verbatim);
     }
 
-    return data || [];
+    return ordered;
   }
 }
\ No newline at end of file
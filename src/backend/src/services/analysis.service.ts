@@ -25,6 +25,15 @@ export const ANALYSIS_STEPS: AnalysisSteps = {
   GENERATING_REPORTS: 'Generating reports'
 };
 
+const STEP_PROGRESS: Record<keyof AnalysisSteps, number> = {
+  PREPROCESSING: 10,
+  EXTRACTING_VERBATIMS: 25,
+  MAPPING_QUESTIONS: 50,
+  EMERGENT_TOPICS: 70,
+  STRATEGIC_ANALYSIS: 85,
+  GENERATING_REPORTS: 95
+};
+
 export class AnalysisService {
 
   async createAnalysisSession(projectId: string): Promise<AnalysisSession> {
@@ -232,16 +241,7 @@ export class AnalysisService {
   }
 
   getStepProgress(step: keyof AnalysisSteps): number {
-    const stepMap = {
-      PREPROCESSING: 10,
-      EXTRACTING_VERBATIMS: 25,
-      MAPPING_QUESTIONS: 50,
-      EMERGENT_TOPICS: 70,
-      STRATEGIC_ANALYSIS: 85,
-      GENERATING_REPORTS: 95
-    };
-    
-    return stepMap[step] || 0;
+    return STEP_PROGRESS[step] || 0;
   }
 
   async deleteAnalysisSession(sessionId: string): Promise<boolean> {
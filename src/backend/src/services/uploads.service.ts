@@ -1,6 +1,7 @@
 import { supabase } from '../config/supabase';
 import { Database } from '../types/database.types';
 import { v4 as uuidv4 } from 'uuid';
+import { createReadStream } from 'fs';
 
 type DiscussionGuide = Database['public']['Tables']['discussion_guides']['Row'];
 type DiscussionGuideInsert = Database['public']['Tables']['discussion_guides']['Insert'];
@@ -17,6 +18,14 @@ export interface FileUploadResult {
 }
 
 export class UploadsService {
+
+  /**
+   * Upload body for a multer file: stream from disk when multer used disk
+   * storage, otherwise fall back to the in-memory buffer.
+   */
+  private getFileBody(file: Express.Multer.File): Buffer | NodeJS.ReadableStream {
+    return file.path ? createReadStream(file.path) : file.buffer;
+  }
   
   async uploadDiscussionGuide(
     projectId: string,
@@ -29,7 +38,7 @@ export class UploadsService {
     
     const { data: uploadData, error: uploadError } = await supabase.storage
       .from('guides')
-      .upload(fileName, file.buffer, {
+      .upload(fileName, this.getFileBody(file), {
         contentType: file.mimetype,
         duplex: 'half'
       });
@@ -75,7 +84,7 @@ export class UploadsService {
     
     const { data: uploadData, error: uploadError } = await supabase.storage
       .from('transcripts')
-      .upload(fileName, file.buffer, {
+      .upload(fileName, this.getFileBody(file), {
         contentType: file.mimetype,
         duplex: 'half'
       });
@@ -0,0 +1,71 @@
+/**
+ * Create a limiter that runs at most `maxConcurrent` tasks at a time.
+ * Extra tasks wait in FIFO order until a running task settles.
+ * A non-finite limit (e.g. NaN from a bad env value) is treated as 1.
+ */
+export function createLimiter(maxConcurrent: number) {
+  const limit = Number.isFinite(maxConcurrent) ? Math.max(1, Math.floor(maxConcurrent)) : 1;
+  const queue: Array<() => void> = [];
+  let active = 0;
+
+  const next = () => {
+    if (active >= limit || queue.length === 0) return;
+    active++;
+    queue.shift()!();
+  };
+
+  return function run<T>(task: () => Promise<T>): Promise<T> {
+    return new Promise<T>((resolve, reject) => {
+      queue.push(() => {
+        Promise.resolve()
+          .then(task)
+          .then(resolve, reject)
+          .finally(() => {
+            active--;
+            next();
+          });
+      });
+      next();
+    });
+  };
+}
+
+/**
+ * Create a limiter that starts at most `maxPerMinute` tasks per minute.
+ * Task starts are spaced evenly so bursts never exceed the provider's rate.
+ * A non-finite rate is treated as 1 per minute rather than disabling throttling.
+ */
+export function createRateLimiter(maxPerMinute: number) {
+  const interval = 60000 / (Number.isFinite(maxPerMinute) ? Math.max(1, maxPerMinute) : 1);
+  let nextStart = 0;
+
+  return function run<T>(task: () => Promise<T>): Promise<T> {
+    const now = Date.now();
+    const startAt = Math.max(now, nextStart);
+    nextStart = startAt + interval;
+
+    const delay = startAt - now;
+    const ready = delay > 0
+      ? new Promise<void>(resolve => setTimeout(resolve, delay))
+      : Promise.resolve();
+    return ready.then(task);
+  };
+}
+
+/**
+ * Like Promise.all, but waits for every promise to settle before rejecting
+ * with the first failure, so no sibling work is left running unobserved.
+ */
+export async function settleAll<T extends readonly unknown[] | []>(
+  promises: T
+): Promise<{ -readonly [P in keyof T]: Awaited<T[P]> }> {
+  const results = await Promise.allSettled(promises);
+  const failure = results.find((result): result is PromiseRejectedResult => result.status === 'rejected');
+  if (failure) {
+    throw failure.reason;
+  }
+
+  return results.map(result => (result as PromiseFulfilledResult<unknown>).value) as {
+    -readonly [P in keyof T]: Awaited<T[P]>
+  };
+}
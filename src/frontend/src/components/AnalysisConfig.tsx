@@ -138,6 +138,8 @@ const PreviewValue = styled.span`
   font-size: ${theme.typography.fontSize.sm};
 `;
 
+const PROJECT_NAME_PATTERN = /^[a-zA-Z0-9\s\-_]+$/;
+
 const AnalysisConfigComponent: React.FC<AnalysisConfigProps> = ({
   onConfigSubmit,
   isLoading = false,
@@ -177,12 +179,13 @@ const AnalysisConfigComponent: React.FC<AnalysisConfigProps> = ({
 
   const validateForm = (): boolean => {
     const newErrors: Record<string, string> = {};
+    const projectName = config.projectName.trim();
     
-    if (!config.projectName.trim()) {
+    if (!projectName) {
       newErrors.projectName = 'Project name is required';
-    } else if (config.projectName.trim().length < 3) {
+    } else if (projectName.length < 3) {
       newErrors.projectName = 'Project name must be at least 3 characters';
-    } else if (!/^[a-zA-Z0-9\s\-_]+$/.test(config.projectName.trim())) {
+    } else if (!PROJECT_NAME_PATTERN.test(projectName)) {
       newErrors.projectName = 'Project name can only contain letters, numbers, spaces, hyphens, and underscores';
     }
     
@@ -1,4 +1,4 @@
-import React, { useState, useRef, useCallback, forwardRef, useImperativeHandle } from 'react';
+import React, { useState, useRef, useCallback, useMemo, forwardRef, useImperativeHandle } from 'react';
 import styled from 'styled-components';
 import { theme } from '../styles/theme';
 import { FileUploadProps } from '../types';
@@ -287,6 +287,12 @@ const FileUpload = forwardRef<FileUploadRef, FileUploadProps>(({
   const [error, setError] = useState<string>('');
   const fileInputRef = useRef<HTMLInputElement>(null);
 
+  // Parse the accepted extensions once per acceptedTypes value instead of per validation
+  const allowedExtensions = useMemo(
+    () => new Set(acceptedTypes.split(',').map(ext => ext.trim().toLowerCase())),
+    [acceptedTypes]
+  );
+
   useImperativeHandle(ref, () => ({
     triggerFileSelect: () => {
       if (fileInputRef.current && !disabled) {
@@ -318,10 +324,10 @@ const FileUpload = forwardRef<FileUploadRef, FileUploadProps>(({
       return `Maximum ${maxFiles} files allowed`;
     }
     
-    const allowedExtensions = acceptedTypes.split(',').map(ext => ext.trim().toLowerCase());
     const invalidFiles = fileArray.filter(file => {
-      const extension = '.' + file.name.split('.').pop()?.toLowerCase();
-      return !allowedExtensions.includes(extension);
+      const dotIndex = file.name.lastIndexOf('.');
+      const extension = dotIndex >= 0 ? file.name.slice(dotIndex).toLowerCase() : '';
+      return !allowedExtensions.has(extension);
     });
     
     if (invalidFiles.length > 0) {
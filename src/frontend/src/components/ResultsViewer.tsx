@@ -1,7 +1,7 @@
 import React, { useState } from 'react';
 import styled from 'styled-components';
 import { theme } from '../styles/theme';
-import { ResultsViewerProps } from '../types';
+import { ResultsViewerProps, Theme } from '../types';
 import { Card } from '../styles/GlobalStyles';
 
 const ResultsContainer = styled.div`
@@ -438,6 +438,19 @@ const EmptyDescription = styled.p`
   margin: 0;
 `;
 
+// Shared by every download card; built once instead of per report per render
+const downloadButtonStyle: React.CSSProperties = {
+  padding: `${theme.spacing[2]} ${theme.spacing[4]}`,
+  background: theme.colors.grey[900],
+  color: theme.colors.text.inverse,
+  border: 'none',
+  borderRadius: theme.borderRadius.md,
+  fontSize: theme.typography.fontSize.sm,
+  fontWeight: theme.typography.fontWeight.semibold,
+  cursor: 'pointer',
+  transition: `all ${theme.transitions.normal}`
+};
+
 const ResultsViewer: React.FC<ResultsViewerProps> = ({
   results,
   onDownload
@@ -498,10 +511,11 @@ const ResultsViewer: React.FC<ResultsViewerProps> = ({
   };
   
   const getSortedFilteredThemes = () => {
+    const keyword = filterKeyword.toLowerCase();
     let filtered = results.themes.filter(theme => 
-      filterKeyword === '' || 
-      theme.name.toLowerCase().includes(filterKeyword.toLowerCase()) ||
-      theme.description.toLowerCase().includes(filterKeyword.toLowerCase())
+      keyword === '' || 
+      theme.name.toLowerCase().includes(keyword) ||
+      theme.description.toLowerCase().includes(keyword)
     );
     
     switch (sortBy) {
@@ -509,18 +523,34 @@ const ResultsViewer: React.FC<ResultsViewerProps> = ({
         return filtered.sort((a, b) => b.frequency - a.frequency);
       case 'alphabetical':
         return filtered.sort((a, b) => a.name.localeCompare(b.name));
-      case 'relevance':
-        // Simple relevance based on frequency and name match
-        return filtered.sort((a, b) => {
-          const aScore = a.frequency + (filterKeyword && a.name.toLowerCase().includes(filterKeyword.toLowerCase()) ? 10 : 0);
-          const bScore = b.frequency + (filterKeyword && b.name.toLowerCase().includes(filterKeyword.toLowerCase()) ? 10 : 0);
-          return bScore - aScore;
-        });
+      case 'relevance': {
+        // Simple relevance based on frequency and name match, scored once per theme
+        const scores = new Map(filtered.map(theme => [
+          theme,
+          theme.frequency + (keyword && theme.name.toLowerCase().includes(keyword) ? 10 : 0)
+        ]));
+        return filtered.sort((a, b) => scores.get(b)! - scores.get(a)!);
+      }
       default:
         return filtered;
     }
   };
 
+  // Aggregates shared by the chart and insights panel, gathered in a single pass
+  let mostSignificantTheme: Theme | null = null;
+  let totalFrequency = 0;
+  let highImpactCount = 0;
+  for (const item of results.themes) {
+    if (!mostSignificantTheme || item.frequency >= mostSignificantTheme.frequency) {
+      mostSignificantTheme = item;
+    }
+    totalFrequency += item.frequency;
+    if (item.frequency > 5) {
+      highImpactCount++;
+    }
+  }
+  const maxFrequency = mostSignificantTheme ? mostSignificantTheme.frequency : -Infinity;
+
   return (
     <ResultsContainer>
       <ResultsHeader>
@@ -642,7 +672,6 @@ const ResultsViewer: React.FC<ResultsViewerProps> = ({
                     Theme Frequency Distribution
                   </h4>
                   {getSortedFilteredThemes().map((theme, index) => {
-                    const maxFrequency = Math.max(...results.themes.map(t => t.frequency));
                     const width = (theme.frequency / maxFrequency) * 100;
                     return (
                       <ChartBar key={theme.id} $width={width}>
@@ -714,12 +743,8 @@ const ResultsViewer: React.FC<ResultsViewerProps> = ({
                       fontSize: theme.typography.fontSize.sm,
                       color: theme.colors.text.secondary
                     }}>
-                      {results.themes.length > 0 && 
-                        `"${results.themes.reduce((prev, current) => 
-                          (prev.frequency > current.frequency) ? prev : current
-                        ).name}" appeared ${results.themes.reduce((prev, current) => 
-                          (prev.frequency > current.frequency) ? prev : current
-                        ).frequency} times across your data.`
+                      {mostSignificantTheme && 
+                        `"${mostSignificantTheme.name}" appeared ${mostSignificantTheme.frequency} times across your data.`
                       }
                     </p>
                   </div>
@@ -742,7 +767,7 @@ const ResultsViewer: React.FC<ResultsViewerProps> = ({
                         color: theme.colors.grey[900],
                         marginBottom: theme.spacing[1]
                       }}>
-                        {Math.round(results.themes.reduce((sum, theme) => sum + theme.frequency, 0) / results.themes.length)}
+                        {Math.round(totalFrequency / results.themes.length)}
                       </div>
                       <div style={{ 
                         fontSize: theme.typography.fontSize.xs,
@@ -767,7 +792,7 @@ const ResultsViewer: React.FC<ResultsViewerProps> = ({
                         color: theme.colors.grey[900],
                         marginBottom: theme.spacing[1]
                       }}>
-                        {results.themes.filter(theme => theme.frequency > 5).length}
+                        {highImpactCount}
                       </div>
                       <div style={{ 
                         fontSize: theme.typography.fontSize.xs,
@@ -792,7 +817,7 @@ const ResultsViewer: React.FC<ResultsViewerProps> = ({
                         color: theme.colors.grey[900],
                         marginBottom: theme.spacing[1]
                       }}>
-                        {Math.round((results.themes.reduce((sum, theme) => sum + theme.frequency, 0) / results.files_processed) * 10) / 10}
+                        {Math.round((totalFrequency / results.files_processed) * 10) / 10}
                       </div>
                       <div style={{ 
                         fontSize: theme.typography.fontSize.xs,
@@ -828,17 +853,7 @@ const ResultsViewer: React.FC<ResultsViewerProps> = ({
                   </DownloadInfo>
                   <button
                     onClick={() => onDownload(report.path)}
-                    style={{
-                      padding: `${theme.spacing[2]} ${theme.spacing[4]}`,
-                      background: theme.colors.grey[900],
-                      color: theme.colors.text.inverse,
-                      border: 'none',
-                      borderRadius: theme.borderRadius.md,
-                      fontSize: theme.typography.fontSize.sm,
-                      fontWeight: theme.typography.fontWeight.semibold,
-                      cursor: 'pointer',
-                      transition: `all ${theme.transitions.normal}`
-                    }}
+                    style={downloadButtonStyle}
                     onMouseEnter={(e) => {
                       e.currentTarget.style.background = theme.colors.grey[800];
                       e.currentTarget.style.transform = 'translateY(-1px)';
@@ -67,6 +67,7 @@ Deno.serve(async (req: Request) => {
 
     // Save topic assignments to database
     const topicRecords = [];
+    const createdAt = new Date().toISOString();
     
     for (const assignment of topicAssignments) {
       for (const verbatimIndex of assignment.verbatim_indices) {
@@ -77,7 +78,7 @@ Deno.serve(async (req: Request) => {
             verbatim_id: verbatim.id,
             broad_topic: assignment.broad_topic,
             sub_topic: assignment.sub_topic,
-            created_at: new Date().toISOString()
+            created_at: createdAt
           });
         }
       }
@@ -64,6 +64,7 @@ Deno.serve(async (req: Request) => {
     const extractedVerbatims = await extractVerbatimsWithAI(content, openaiApiKey);
 
     // Save verbatims to database
+    const createdAt = new Date().toISOString();
     const verbatimRecords = extractedVerbatims.map((v: ExtractedVerbatim) => ({
       project_id: projectId,
       transcript_id: transcriptId,
@@ -71,7 +72,7 @@ Deno.serve(async (req: Request) => {
       speaker: v.speaker,
       source_file: fileName,
       line_number: v.line_number || null,
-      created_at: new Date().toISOString()
+      created_at: createdAt
     }));
 
     const { data, error } = await supabase
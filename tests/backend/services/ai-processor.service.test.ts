@@ -0,0 +1,165 @@
+import { AIProcessorService, ObjectiveData } from '../../../src/backend/src/services/ai-processor.service';
+import { supabase } from '../../../src/backend/src/config/supabase';
+import { Database } from '../../../src/backend/src/types/database.types';
+
+// Mock the shared Supabase client used by the service
+jest.mock('../../../src/backend/src/config/supabase', () => {
+  const mockSupabase: any = {
+    from: jest.fn(() => mockSupabase),
+    insert: jest.fn(() => mockSupabase),
+    select: jest.fn()
+  };
+  return { supabase: mockSupabase };
+});
+
+const mockSupabase = supabase as any;
+
+type Verbatim = Database['public']['Tables']['qualitative_verbatims']['Row'];
+type EmergentTopic = Database['public']['Tables']['emergent_topics']['Row'];
+
+const makeVerbatim = (id: string, text: string): Verbatim => ({
+  id,
+  project_id: 'project-1',
+  transcript_id: 'transcript-1',
+  text,
+  speaker: 'Respondent',
+  source_file: 'transcript.txt',
+  line_number: null,
+  created_at: new Date().toISOString()
+});
+
+const makeTopic = (verbatimId: string, broadTopic: string, subTopic: string): EmergentTopic => ({
+  id: `topic-${verbatimId}-${broadTopic}-${subTopic}`,
+  project_id: 'project-1',
+  verbatim_id: verbatimId,
+  broad_topic: broadTopic,
+  sub_topic: subTopic,
+  created_at: new Date().toISOString()
+});
+
+describe('AIProcessorService', () => {
+  let aiProcessorService: AIProcessorService;
+
+  beforeEach(() => {
+    jest.clearAllMocks();
+    aiProcessorService = new AIProcessorService();
+  });
+
+  describe('groupTopicVerbatims', () => {
+    it('should group verbatims by broad and sub topic in first-seen order', () => {
+      const verbatims = [
+        makeVerbatim('v1', 'Price is too high'),
+        makeVerbatim('v2', 'Checkout was slow'),
+        makeVerbatim('v3', 'Shipping costs add up')
+      ];
+      const topics = [
+        makeTopic('v2', 'Experience', 'Checkout'),
+        makeTopic('v1', 'Cost', 'Pricing'),
+        makeTopic('v3', 'Cost', 'Shipping'),
+        makeTopic('v3', 'Cost', 'Pricing')
+      ];
+
+      const groups = aiProcessorService.groupTopicVerbatims(topics, verbatims);
+
+      expect(groups.map(group => [group.broad_topic, group.sub_topic])).toEqual([
+        ['Experience', 'Checkout'],
+        ['Cost', 'Pricing'],
+        ['Cost', 'Shipping']
+      ]);
+      expect(groups[0].verbatims.map(v => v.id)).toEqual(['v2']);
+      expect(groups[1].verbatims.map(v => v.id)).toEqual(['v1', 'v3']);
+      expect(groups[2].verbatims.map(v => v.id)).toEqual(['v3']);
+    });
+
+    it('should keep the same sub topic name separate under different broad topics', () => {
+      const verbatims = [makeVerbatim('v1', 'First'), makeVerbatim('v2', 'Second')];
+      const topics = [
+        makeTopic('v1', 'Cost', 'Other'),
+        makeTopic('v2', 'Experience', 'Other')
+      ];
+
+      const groups = aiProcessorService.groupTopicVerbatims(topics, verbatims);
+
+      expect(groups).toHaveLength(2);
+      expect(groups[0]).toMatchObject({ broad_topic: 'Cost', sub_topic: 'Other' });
+      expect(groups[1]).toMatchObject({ broad_topic: 'Experience', sub_topic: 'Other' });
+    });
+
+    it('should skip assignments whose verbatim is not part of this run', () => {
+      const verbatims = [makeVerbatim('v1', 'Current run')];
+      const topics = [
+        makeTopic('stale-verbatim', 'Legacy', 'Old'),
+        makeTopic('v1', 'Cost', 'Pricing')
+      ];
+
+      const groups = aiProcessorService.groupTopicVerbatims(topics, verbatims);
+
+      expect(groups).toHaveLength(1);
+      expect(groups[0]).toMatchObject({ broad_topic: 'Cost', sub_topic: 'Pricing' });
+      expect(groups[0].verbatims.map(v => v.id)).toEqual(['v1']);
+    });
+  });
+
+  describe('mapVerbatimsToQuestions', () => {
+    const objectives: ObjectiveData[] = [
+      { id: 'ID-1', section: 'Pricing', question: 'How do you feel about the price?', objective: 'Price perception' }
+    ];
+
+    beforeEach(() => {
+      // Echo the inserted records back as the saved rows
+      mockSupabase.select.mockImplementation(() => Promise.resolve({
+        data: mockSupabase.insert.mock.calls[mockSupabase.insert.mock.calls.length - 1][0],
+        error: null
+      }));
+    });
+
+    it('should send each distinct text once and copy its mapping to duplicates', async () => {
+      const verbatims = [
+        makeVerbatim('v1', 'Too expensive for what it does'),
+        makeVerbatim('v2', 'Fair value overall'),
+        makeVerbatim('v3', 'Too expensive for what it does')
+      ];
+      const completeJson = jest.spyOn(aiProcessorService as any, 'completeJson').mockResolvedValue([
+        { verbatim_index: 1, best_fit_question_id: 'ID-1', confidence: 'High', reasoning: 'Price complaint' },
+        { verbatim_index: 2, best_fit_question_id: 'ID-1', confidence: 'Medium', reasoning: 'Price praise' }
+      ]);
+
+      const result = await aiProcessorService.mapVerbatimsToQuestions('project-1', verbatims, objectives);
+
+      expect(completeJson).toHaveBeenCalledTimes(1);
+      const prompt = completeJson.mock.calls[0][0] as string;
+      expect(prompt.split('"Too expensive for what it does"')).toHaveLength(2);
+      expect(prompt).toContain('"Fair value overall"');
+
+      const inserted = mockSupabase.insert.mock.calls[0][0];
+      expect(inserted).toHaveLength(3);
+      expect(inserted.map((record: any) => record.verbatim_id).sort()).toEqual(['v1', 'v2', 'v3']);
+      expect(new Set(inserted.map((record: any) => record.id)).size).toBe(3);
+
+      const original = inserted.find((record: any) => record.verbatim_id === 'v1');
+      const duplicate = inserted.find((record: any) => record.verbatim_id === 'v3');
+      expect(duplicate.id).not.toBe(original.id);
+      expect({ ...duplicate, id: original.id, verbatim_id: 'v1' }).toEqual(original);
+
+      expect(result).toHaveLength(3);
+    });
+
+    it('should batch only the distinct texts', async () => {
+      const verbatims = [
+        makeVerbatim('v1', 'Yes, definitely'),
+        makeVerbatim('v2', 'It feels premium'),
+        makeVerbatim('v3', 'Yes, definitely'),
+        makeVerbatim('v4', 'Yes, definitely')
+      ];
+      const completeJson = jest.spyOn(aiProcessorService as any, 'completeJson').mockResolvedValue([
+        { verbatim_index: 1, best_fit_question_id: 'ID-1', confidence: 'High', reasoning: 'Relevant' }
+      ]);
+
+      await aiProcessorService.mapVerbatimsToQuestions('project-1', verbatims, objectives, 1);
+
+      expect(completeJson).toHaveBeenCalledTimes(2);
+      const inserted = mockSupabase.insert.mock.calls[0][0];
+      expect(inserted.map((record: any) => record.verbatim_id).sort()).toEqual(['v1', 'v2', 'v3', 'v4']);
+    });
+  });
+});
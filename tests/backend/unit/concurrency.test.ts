@@ -0,0 +1,134 @@
+import { createLimiter, createRateLimiter, settleAll } from '../../../src/backend/src/utils/concurrency';
+
+const deferred = () => {
+  let resolve!: () => void;
+  const promise = new Promise<void>(r => { resolve = r; });
+  return { promise, resolve };
+};
+
+describe('createLimiter', () => {
+  it('should never run more than the configured number of tasks at once', async () => {
+    const run = createLimiter(2);
+    let active = 0;
+    let peak = 0;
+
+    const task = async () => {
+      active++;
+      peak = Math.max(peak, active);
+      await new Promise(resolve => setTimeout(resolve, 5));
+      active--;
+    };
+
+    await Promise.all(Array.from({ length: 6 }, () => run(task)));
+
+    expect(peak).toBe(2);
+  });
+
+  it('should start queued tasks in FIFO order', async () => {
+    const run = createLimiter(1);
+    const gate = deferred();
+    const order: number[] = [];
+
+    const first = run(async () => { await gate.promise; order.push(1); });
+    const second = run(async () => { order.push(2); });
+    const third = run(async () => { order.push(3); });
+
+    gate.resolve();
+    await Promise.all([first, second, third]);
+
+    expect(order).toEqual([1, 2, 3]);
+  });
+
+  it('should run one task at a time when the limit is not a number', async () => {
+    const run = createLimiter(NaN);
+    let active = 0;
+    let peak = 0;
+
+    const task = async () => {
+      active++;
+      peak = Math.max(peak, active);
+      await new Promise(resolve => setTimeout(resolve, 5));
+      active--;
+    };
+
+    await Promise.all(Array.from({ length: 6 }, () => run(task)));
+
+    expect(peak).toBe(1);
+  });
+
+  it('should propagate rejections and keep draining the queue', async () => {
+    const run = createLimiter(1);
+
+    const failing = run(async () => { throw new Error('boom'); });
+    const following = run(async () => 'ok');
+
+    await expect(failing).rejects.toThrow('boom');
+    await expect(following).resolves.toBe('ok');
+  });
+});
+
+describe('createRateLimiter', () => {
+  it('should space task starts evenly across the minute', async () => {
+    const run = createRateLimiter(1200);
+    const starts: number[] = [];
+
+    await Promise.all(Array.from({ length: 3 }, () => run(async () => { starts.push(Date.now()); })));
+
+    expect(starts[1] - starts[0]).toBeGreaterThanOrEqual(45);
+    expect(starts[2] - starts[1]).toBeGreaterThanOrEqual(45);
+  });
+
+  it('should start the first task immediately', async () => {
+    const run = createRateLimiter(1);
+    const before = Date.now();
+
+    await run(async () => undefined);
+
+    expect(Date.now() - before).toBeLessThan(50);
+  });
+
+  it('should still throttle when the rate is not a number', async () => {
+    jest.useFakeTimers();
+    try {
+      const run = createRateLimiter(NaN);
+      const started: number[] = [];
+
+      const first = run(async () => { started.push(1); });
+      const second = run(async () => { started.push(2); });
+
+      await first;
+      expect(started).toEqual([1]);
+
+      await jest.advanceTimersByTimeAsync(60000);
+      await second;
+      expect(started).toEqual([1, 2]);
+    } finally {
+      jest.useRealTimers();
+    }
+  });
+});
+
+describe('settleAll', () => {
+  it('should resolve with every value in order', async () => {
+    await expect(settleAll([Promise.resolve(1), Promise.resolve('two')])).resolves.toEqual([1, 'two']);
+  });
+
+  it('should reject only after every sibling has settled', async () => {
+    const slow = deferred();
+    let slowFinished = false;
+
+    const settled = settleAll([
+      Promise.reject(new Error('boom')),
+      slow.promise.then(() => { slowFinished = true; })
+    ]);
+
+    let rejected = false;
+    settled.catch(() => { rejected = true; });
+    await new Promise(resolve => setTimeout(resolve, 5));
+    expect(rejected).toBe(false);
+
+    slow.resolve();
+    await expect(settled).rejects.toThrow('boom');
+    expect(slowFinished).toBe(true);
+  });
+});